@@ -953,16 +953,24 @@ class ReactionExplicit:
     reactants: tuple[DataPacketE[MolDatBase], ...]
     products: tuple[DataPacketE[MolDatBase], ...]
     reaction_meta: typing.Optional[collections.abc.Mapping]
+    _uid: typing.Optional[Identifier] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def uid(
         self,
     ) -> Identifier:
-        return (
-            self.operator.item.uid,
-            tuple(mol.item.uid for mol in self.reactants),
-            tuple(mol.item.uid for mol in self.products),
-        )
+        # computed on first access and stored on the (frozen) instance
+        uid = self._uid
+        if uid is None:
+            uid = (
+                self.operator.item.uid,
+                tuple(mol.item.uid for mol in self.reactants),
+                tuple(mol.item.uid for mol in self.products),
+            )
+            object.__setattr__(self, "_uid", uid)
+        return uid
 
 
 @typing.final
@@ -2333,6 +2341,35 @@ class ChemNetwork(abc.ABC):
             compatibility testing.
         """
 
+    def add_mols(
+        self,
+        mols: collections.abc.Iterable[MolDatBase],
+        meta: typing.Optional[collections.abc.Mapping] = None,
+        reactive: typing.Optional[bool] = None,
+    ) -> collections.abc.Sequence[MolIndex]:
+        """
+        Add several molecules to the network.
+
+        Equivalent to calling `add_mol` on each molecule in turn, though
+        implementations may test operator compatibility for the whole batch
+        at once.
+
+        Parameters
+        ----------
+        mols : collections.abc.Iterable[MolDatBase]
+            Molecules to be added.
+        meta : typing.Optional[collections.abc.Mapping] (default: None)
+            Metadata associated with every molecule.
+        reactive : typing.Optional[bool] (default: None)
+            Reactivity of every molecule; see `add_mol`.
+
+        Returns
+        -------
+        collections.abc.Sequence[MolIndex]
+            Indices of molecules in table, in input order.
+        """
+        return [self.add_mol(mol, meta, reactive) for mol in mols]
+
     @abc.abstractmethod
     def add_op(
         self,
@@ -2454,7 +2491,10 @@ class ChemNetwork(abc.ABC):
             },
         )
         data.text = str(
-            base64.urlsafe_b64encode(pickle.dumps(self)), encoding="ascii"
+            base64.urlsafe_b64encode(
+                pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+            ),
+            encoding="ascii",
         )
         tree = ET.ElementTree(data)
         with gzip.open(temp_filepath, "w", compress_level) as fout:
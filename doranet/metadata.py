@@ -1,8 +1,10 @@
 """Logic and interfaces for metadata processing."""
 
 import abc
+import collections
 import collections.abc
 import dataclasses
+import functools
 import itertools
 import operator
 import typing
@@ -21,6 +23,13 @@ class MetaSink(typing.Protocol):
 _T = typing.TypeVar("_T")
 _U = typing.TypeVar("_U")
 MetaDataResolverFunc = collections.abc.Callable[[_T, _T], _T]
+CalcCache = dict[
+    int,
+    dict[
+        tuple[interfaces.Identifier, int],
+        tuple[typing.Optional[collections.abc.Mapping], typing.Any],
+    ],
+]
 
 
 def TrivialMetaDataResolverFunc(a: _T, b: _T) -> _T:
@@ -28,6 +37,8 @@ def TrivialMetaDataResolverFunc(a: _T, b: _T) -> _T:
 
 
 class LocalPropertyCalc(abc.ABC, typing.Generic[_T]):
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def key(self) -> collections.abc.Hashable: ...
@@ -112,6 +123,8 @@ class LocalPropertyCalc(abc.ABC, typing.Generic[_T]):
 
 
 class MolPropertyCalc(LocalPropertyCalc[_T]):
+    __slots__ = ()
+
     @abc.abstractmethod
     def __call__(
         self,
@@ -121,6 +134,8 @@ class MolPropertyCalc(LocalPropertyCalc[_T]):
 
 
 class MolPropertyFromRxnCalc(LocalPropertyCalc[_T]):
+    __slots__ = ()
+
     @abc.abstractmethod
     def __call__(
         self,
@@ -131,6 +146,8 @@ class MolPropertyFromRxnCalc(LocalPropertyCalc[_T]):
 
 
 class OpPropertyCalc(LocalPropertyCalc[_T]):
+    __slots__ = ()
+
     @abc.abstractmethod
     def __call__(
         self,
@@ -140,6 +157,8 @@ class OpPropertyCalc(LocalPropertyCalc[_T]):
 
 
 class OpPropertyFromRxnCalc(LocalPropertyCalc[_T]):
+    __slots__ = ()
+
     @abc.abstractmethod
     def __call__(
         self,
@@ -150,6 +169,8 @@ class OpPropertyFromRxnCalc(LocalPropertyCalc[_T]):
 
 
 class RxnPropertyCalc(LocalPropertyCalc[_T]):
+    __slots__ = ()
+
     @abc.abstractmethod
     def __call__(
         self,
@@ -172,28 +193,29 @@ class KeyOutput:
         )
 
     def __and__(self, other: "KeyOutput") -> "KeyOutput":
-        new_mol_keys = self.mol_keys | other.mol_keys
-        if len(new_mol_keys) > len(self.mol_keys) + len(other.mol_keys):
-            raise KeyError(
-                f"""Conflicting molecule metadata key outputs {self.mol_keys &
-                    other.mol_keys}; separate expressions with >> or combine
-                    using other operator"""
-            )
-        new_op_keys = self.op_keys | other.op_keys
-        if len(new_op_keys) > len(self.op_keys) + len(other.op_keys):
-            raise KeyError(
-                f"""Conflicting operator metadata key outputs {self.op_keys &
-                    other.op_keys}; separate expressions with >> or combine
-                    using other operator"""
-            )
-        new_rxn_keys = self.rxn_keys | other.rxn_keys
-        if len(new_rxn_keys) > len(self.rxn_keys) + len(other.rxn_keys):
-            raise KeyError(
-                f"""Conflicting reaction metadata key outputs {self.rxn_keys &
-                    other.rxn_keys}; separate expressions with >> or combine
-                    using other operator"""
-            )
-        return KeyOutput(new_mol_keys, new_op_keys, new_rxn_keys)
+        return KeyOutput(
+            _disjoint_key_union(self.mol_keys, other.mol_keys, "molecule"),
+            _disjoint_key_union(self.op_keys, other.op_keys, "operator"),
+            _disjoint_key_union(self.rxn_keys, other.rxn_keys, "reaction"),
+        )
+
+
+def _disjoint_key_union(
+    keys1: frozenset[collections.abc.Hashable],
+    keys2: frozenset[collections.abc.Hashable],
+    key_type: str,
+) -> frozenset[collections.abc.Hashable]:
+    # frozensets are immutable, so an empty side lets the other be reused
+    if not keys1:
+        return keys2
+    if not keys2:
+        return keys1
+    if not keys1.isdisjoint(keys2):
+        raise KeyError(
+            f"""Conflicting {key_type} metadata key outputs {keys1 & keys2};
+                separate expressions with >> or combine using other operator"""
+        )
+    return keys1 | keys2
 
 
 class ReactionFilterBase(abc.ABC):
@@ -292,11 +314,22 @@ class ReactionFilterXor(ReactionFilterBase):
 
 
 class PropertyCompositor(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def __call__(
         self, rxn: interfaces.ReactionExplicit
     ) -> "MetaPropertyState": ...
 
+    def _call_cached(
+        self,
+        rxn: interfaces.ReactionExplicit,
+        calc_cache: typing.Optional[CalcCache],
+    ) -> "MetaPropertyState":
+        # compositors which can reuse calculator results across the reactions
+        # of one analysis step override this; others are simply called
+        return self(rxn)
+
     @property
     @abc.abstractmethod
     def keys(self) -> KeyOutput: ...
@@ -369,7 +402,7 @@ class PropertyCompositor(abc.ABC):
 
 
 class MergePropertyCompositor(PropertyCompositor):
-    __slots__ = ("_comp1", "_comp2")
+    __slots__ = ("_comp1", "_comp2", "_keys")
 
     _comp1: PropertyCompositor
     _comp2: PropertyCompositor
@@ -383,8 +416,15 @@ class MergePropertyCompositor(PropertyCompositor):
         self._keys = comp1.keys & comp2.keys
 
     def __call__(self, rxn: interfaces.ReactionExplicit) -> "MetaPropertyState":
-        state1 = self._comp1(rxn)
-        state2 = self._comp2(rxn)
+        return self._call_cached(rxn, None)
+
+    def _call_cached(
+        self,
+        rxn: interfaces.ReactionExplicit,
+        calc_cache: typing.Optional[CalcCache],
+    ) -> "MetaPropertyState":
+        state1 = self._comp1._call_cached(rxn, calc_cache)
+        state2 = self._comp2._call_cached(rxn, calc_cache)
         state1.mol_info.update(state2.mol_info)
         state1.op_info.update(state2.op_info)
         state1.rxn_info.update(state2.rxn_info)
@@ -412,8 +452,15 @@ class FunctionPropertyCompositor(PropertyCompositor):
     _comp2: PropertyCompositor
 
     def __call__(self, rxn: interfaces.ReactionExplicit) -> "MetaPropertyState":
-        state1 = self._comp1(rxn)
-        state2 = self._comp2(rxn)
+        return self._call_cached(rxn, None)
+
+    def _call_cached(
+        self,
+        rxn: interfaces.ReactionExplicit,
+        calc_cache: typing.Optional[CalcCache],
+    ) -> "MetaPropertyState":
+        state1 = self._comp1._call_cached(rxn, calc_cache)
+        state2 = self._comp2._call_cached(rxn, calc_cache)
 
         for key in state1.mol_info.keys() & state2.mol_info.keys():
             propstate1 = state1.mol_info[key]
@@ -464,25 +511,88 @@ class FunctionPropertyCompositor(PropertyCompositor):
         return self._comp1.resolver | self._comp2.resolver
 
 
+def _cached_calc(
+    calc: collections.abc.Callable[[interfaces.DataPacketE], _T],
+    data: interfaces.DataPacketE,
+    cache: dict[
+        tuple[interfaces.Identifier, int],
+        tuple[typing.Optional[collections.abc.Mapping], typing.Any],
+    ],
+) -> _T:
+    # calculators which do not depend on the reaction are only a function of
+    # the packet, so results are reused while the packet metadata is unchanged
+    key = (data.item.uid, data.i)
+    entry = cache.get(key)
+    meta = data.meta
+    if entry is not None and (entry[0] is meta or entry[0] == meta):
+        return entry[1]
+    value = calc(data)
+    cache[key] = (meta, value)
+    return value
+
+
+class _CalcPropertyCompositor(PropertyCompositor):
+    # key, resolver, and key output of the wrapped calculator are computed
+    # once on construction, since they are accessed for every reaction
+    __slots__ = ("_key", "_resolver", "_keys")
+
+    # 0, 1, 2 correspond to molecule, operator, and reaction keys
+    _domain: typing.ClassVar[int]
+
+    _calc: LocalPropertyCalc
+    _key: collections.abc.Hashable
+    _resolver: MetaDataResolverFunc
+    _keys: KeyOutput
+
+    def __post_init__(self) -> None:
+        key = self._calc.key
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_resolver", self._calc.resolver)
+        keys: list[frozenset[collections.abc.Hashable]] = [
+            frozenset(),
+            frozenset(),
+            frozenset(),
+        ]
+        keys[self._domain] = frozenset((key,))
+        object.__setattr__(self, "_keys", KeyOutput(*keys))
+
+    @property
+    def keys(self) -> KeyOutput:
+        return self._keys
+
+
 @dataclasses.dataclass(frozen=True)
-class MolPropertyCompositor(PropertyCompositor, typing.Generic[_T]):
+class MolPropertyCompositor(_CalcPropertyCompositor, typing.Generic[_T]):
     __slots__ = ("_calc",)
+    _domain = 0
 
     _calc: MolPropertyCalc[_T]
 
     def __call__(self, rxn: interfaces.ReactionExplicit) -> "MetaPropertyState":
-        mols = itertools.chain(rxn.reactants, rxn.products)
-        props = {
-            mol.item.uid: calc
-            for mol, calc in ((mol, self._calc(mol)) for mol in mols)
-            if calc is not None
-        }
-        single_state = MetaPropertyStateSingleProp(props, self._calc.resolver)
-        return MetaPropertyState({self._calc.key: single_state}, {}, {})
+        return self._call_cached(rxn, None)
 
-    @property
-    def keys(self) -> KeyOutput:
-        return KeyOutput(frozenset((self._calc.key,)), frozenset(), frozenset())
+    def _call_cached(
+        self,
+        rxn: interfaces.ReactionExplicit,
+        calc_cache: typing.Optional[CalcCache],
+    ) -> "MetaPropertyState":
+        calc_func = self._calc
+        props: dict[interfaces.Identifier, _T] = {}
+        if calc_cache is None:
+            for mols in (rxn.reactants, rxn.products):
+                for mol in mols:
+                    calc = calc_func(mol)
+                    if calc is not None:
+                        props[mol.item.uid] = calc
+        else:
+            cache = calc_cache.setdefault(id(calc_func), {})
+            for mols in (rxn.reactants, rxn.products):
+                for mol in mols:
+                    calc = _cached_calc(calc_func, mol, cache)
+                    if calc is not None:
+                        props[mol.item.uid] = calc
+        single_state = MetaPropertyStateSingleProp(props, self._resolver)
+        return MetaPropertyState({self._key: single_state}, {}, {})
 
     @property
     def meta_required(self) -> interfaces.MetaKeyPacket:
@@ -490,29 +600,26 @@ class MolPropertyCompositor(PropertyCompositor, typing.Generic[_T]):
 
     @property
     def resolver(self) -> "MetaUpdateResolver":
-        calc = self._calc
-        return MetaUpdateResolver({calc.key: calc.resolver}, {}, {})
+        return MetaUpdateResolver({self._key: self._resolver}, {}, {})
 
 
 @dataclasses.dataclass(frozen=True)
-class MolRxnPropertyCompositor(PropertyCompositor, typing.Generic[_T]):
+class MolRxnPropertyCompositor(_CalcPropertyCompositor, typing.Generic[_T]):
     __slots__ = ("_calc",)
+    _domain = 0
 
     _calc: MolPropertyFromRxnCalc[_T]
 
     def __call__(self, rxn: interfaces.ReactionExplicit) -> "MetaPropertyState":
-        mols = itertools.chain(rxn.reactants, rxn.products)
-        props = {
-            mol.item.uid: calc
-            for mol, calc in ((mol, self._calc(mol, rxn)) for mol in mols)
-            if calc is not None
-        }
-        single_state = MetaPropertyStateSingleProp(props, self._calc.resolver)
-        return MetaPropertyState({self._calc.key: single_state}, {}, {})
-
-    @property
-    def keys(self) -> KeyOutput:
-        return KeyOutput(frozenset((self._calc.key,)), frozenset(), frozenset())
+        calc_func = self._calc
+        props: dict[interfaces.Identifier, _T] = {}
+        for mols in (rxn.reactants, rxn.products):
+            for mol in mols:
+                calc = calc_func(mol, rxn)
+                if calc is not None:
+                    props[mol.item.uid] = calc
+        single_state = MetaPropertyStateSingleProp(props, self._resolver)
+        return MetaPropertyState({self._key: single_state}, {}, {})
 
     @property
     def meta_required(self) -> interfaces.MetaKeyPacket:
@@ -520,27 +627,34 @@ class MolRxnPropertyCompositor(PropertyCompositor, typing.Generic[_T]):
 
     @property
     def resolver(self) -> "MetaUpdateResolver":
-        calc = self._calc
-        return MetaUpdateResolver({calc.key: calc.resolver}, {}, {})
+        return MetaUpdateResolver({self._key: self._resolver}, {}, {})
 
 
 @dataclasses.dataclass(frozen=True)
-class OpPropertyCompositor(PropertyCompositor, typing.Generic[_T]):
+class OpPropertyCompositor(_CalcPropertyCompositor, typing.Generic[_T]):
     __slots__ = ("_calc",)
+    _domain = 1
 
     _calc: OpPropertyCalc[_T]
 
     def __call__(self, rxn: interfaces.ReactionExplicit) -> "MetaPropertyState":
-        calc = self._calc(rxn.operator)
+        return self._call_cached(rxn, None)
+
+    def _call_cached(
+        self,
+        rxn: interfaces.ReactionExplicit,
+        calc_cache: typing.Optional[CalcCache],
+    ) -> "MetaPropertyState":
+        if calc_cache is None:
+            calc = self._calc(rxn.operator)
+        else:
+            cache = calc_cache.setdefault(id(self._calc), {})
+            calc = _cached_calc(self._calc, rxn.operator, cache)
         if calc is None:
             return MetaPropertyState({}, {}, {})
         props = {rxn.operator.item.uid: calc}
-        single_state = MetaPropertyStateSingleProp(props, self._calc.resolver)
-        return MetaPropertyState({}, {self._calc.key: single_state}, {})
-
-    @property
-    def keys(self) -> KeyOutput:
-        return KeyOutput(frozenset(), frozenset((self._calc.key,)), frozenset())
+        single_state = MetaPropertyStateSingleProp(props, self._resolver)
+        return MetaPropertyState({}, {self._key: single_state}, {})
 
     @property
     def meta_required(self) -> interfaces.MetaKeyPacket:
@@ -548,13 +662,13 @@ class OpPropertyCompositor(PropertyCompositor, typing.Generic[_T]):
 
     @property
     def resolver(self) -> "MetaUpdateResolver":
-        calc = self._calc
-        return MetaUpdateResolver({}, {calc.key: calc.resolver}, {})
+        return MetaUpdateResolver({}, {self._key: self._resolver}, {})
 
 
 @dataclasses.dataclass(frozen=True)
-class OpRxnPropertyCompositor(PropertyCompositor, typing.Generic[_T]):
+class OpRxnPropertyCompositor(_CalcPropertyCompositor, typing.Generic[_T]):
     __slots__ = ("_calc",)
+    _domain = 1
 
     _calc: OpPropertyFromRxnCalc[_T]
 
@@ -563,12 +677,8 @@ class OpRxnPropertyCompositor(PropertyCompositor, typing.Generic[_T]):
         if calc is None:
             return MetaPropertyState({}, {}, {})
         props = {rxn.operator.item.uid: calc}
-        single_state = MetaPropertyStateSingleProp(props, self._calc.resolver)
-        return MetaPropertyState({}, {self._calc.key: single_state}, {})
-
-    @property
-    def keys(self) -> KeyOutput:
-        return KeyOutput(frozenset(), frozenset((self._calc.key,)), frozenset())
+        single_state = MetaPropertyStateSingleProp(props, self._resolver)
+        return MetaPropertyState({}, {self._key: single_state}, {})
 
     @property
     def meta_required(self) -> interfaces.MetaKeyPacket:
@@ -576,13 +686,13 @@ class OpRxnPropertyCompositor(PropertyCompositor, typing.Generic[_T]):
 
     @property
     def resolver(self) -> "MetaUpdateResolver":
-        calc = self._calc
-        return MetaUpdateResolver({}, {calc.key: calc.resolver}, {})
+        return MetaUpdateResolver({}, {self._key: self._resolver}, {})
 
 
 @dataclasses.dataclass(frozen=True)
-class RxnPropertyCompositor(PropertyCompositor, typing.Generic[_T]):
+class RxnPropertyCompositor(_CalcPropertyCompositor, typing.Generic[_T]):
     __slots__ = ("_calc",)
+    _domain = 2
 
     _calc: RxnPropertyCalc[_T]
 
@@ -593,13 +703,9 @@ class RxnPropertyCompositor(PropertyCompositor, typing.Generic[_T]):
         props = {rxn.uid: calc}
         single_state = MetaPropertyStateSingleProp(
             props,
-            self._calc.resolver,  # type: ignore
+            self._resolver,  # type: ignore
         )
-        return MetaPropertyState({}, {}, {self._calc.key: single_state})
-
-    @property
-    def keys(self) -> KeyOutput:
-        return KeyOutput(frozenset(), frozenset(), frozenset((self._calc.key,)))
+        return MetaPropertyState({}, {}, {self._key: single_state})
 
     @property
     def meta_required(self) -> interfaces.MetaKeyPacket:
@@ -607,8 +713,7 @@ class RxnPropertyCompositor(PropertyCompositor, typing.Generic[_T]):
 
     @property
     def resolver(self) -> "MetaUpdateResolver":
-        calc = self._calc
-        return MetaUpdateResolver({}, {}, {calc.key: calc.resolver})
+        return MetaUpdateResolver({}, {}, {self._key: self._resolver})
 
 
 @dataclasses.dataclass
@@ -629,22 +734,27 @@ class MetaPropertyStateSingleProp(typing.Generic[_T]):
     def __or__(
         self, other: "MetaPropertyStateSingleProp[_T]"
     ) -> "MetaPropertyStateSingleProp[_T]":
-        resolved_props: dict[interfaces.Identifier, _T] = {}
-        if len(self.data) == 0:
+        self_data = self.data
+        other_data = other.data
+        if len(self_data) == 0:
             return other
-        if len(other.data) == 0:
+        if len(other_data) == 0:
             self.resolver = other.resolver
             return self
-        common_keys = self.data.keys() & other.data.keys()
-        if len(common_keys) == 0:
-            other.data.update(self.data)
-            return other
-        for item_key in common_keys:
-            resolved_props[item_key] = self.resolver(
-                self.data[item_key], other.data[item_key]
-            )
-        other.data.update(self.data)
-        other.data.update(resolved_props)
+        # drive the intersection from the smaller side to minimize probes
+        if len(self_data) <= len(other_data):
+            small, large = self_data, other_data
+        else:
+            small, large = other_data, self_data
+        # self is consumed by the merge, so resolved values are written into
+        # its data in place and then copied over other's in a single update
+        resolver = self.resolver
+        for item_key in small:
+            if item_key in large:
+                self_data[item_key] = resolver(
+                    self_data[item_key], other_data[item_key]
+                )
+        other_data.update(self_data)
         return other
 
 
@@ -658,53 +768,33 @@ class MetaPropertyState:
     rxn_info: dict[collections.abc.Hashable, MetaPropertyStateSingleProp]
 
     def __or__(self, other: "MetaPropertyState") -> "MetaPropertyState":
-        if len(self.mol_info) == 0:
-            self.mol_info = other.mol_info
-        elif len(other.mol_info) != 0:
-            common_keys = self.mol_info.keys() & other.mol_info.keys()
-            if len(common_keys) == 0:
-                self.mol_info.update(other.mol_info)
-            else:
-                resolved_info: dict[collections.abc.Hashable, typing.Any] = {}
-                for prop_key in common_keys:
-                    resolved_info[prop_key] = (
-                        self.mol_info[prop_key] | other.mol_info[prop_key]
-                    )
-                self.mol_info.update(other.mol_info)
-                self.mol_info.update(resolved_info)
-        if len(self.op_info) == 0:
-            self.op_info = other.op_info
-        elif len(other.op_info) != 0:
-            common_keys = self.op_info.keys() & other.op_info.keys()
-            if len(common_keys) == 0:
-                self.op_info.update(other.op_info)
-            else:
-                resolved_info = {}
-                for prop_key in common_keys:
-                    resolved_info[prop_key] = (
-                        self.op_info[prop_key] | other.op_info[prop_key]
-                    )
-                self.op_info.update(other.op_info)
-                self.op_info.update(resolved_info)
-        if len(self.rxn_info) == 0:
-            self.rxn_info = other.rxn_info
-        elif len(other.rxn_info) != 0:
-            common_keys = self.rxn_info.keys() & other.rxn_info.keys()
-            if len(common_keys) == 0:
-                self.rxn_info.update(other.rxn_info)
-            else:
-                resolved_info = {}
-                for prop_key in common_keys:
-                    resolved_info[prop_key] = (
-                        self.rxn_info[prop_key] | other.rxn_info[prop_key]
-                    )
-                self.rxn_info.update(other.rxn_info)
-                self.rxn_info.update(resolved_info)
-
+        self.mol_info = _merge_prop_info(self.mol_info, other.mol_info)
+        self.op_info = _merge_prop_info(self.op_info, other.op_info)
+        self.rxn_info = _merge_prop_info(self.rxn_info, other.rxn_info)
         return self
 
 
+def _merge_prop_info(
+    info1: dict[collections.abc.Hashable, MetaPropertyStateSingleProp],
+    info2: dict[collections.abc.Hashable, MetaPropertyStateSingleProp],
+) -> dict[collections.abc.Hashable, MetaPropertyStateSingleProp]:
+    # merges info2 into info1 (or returns info2 if info1 is empty)
+    if len(info1) == 0:
+        return info2
+    if len(info2) == 0:
+        return info1
+    # info2 is consumed by the merge, so resolved states replace its entries
+    # in place before the single update into info1
+    for prop_key, prop_state in info2.items():
+        if prop_key in info1:
+            info2[prop_key] = info1[prop_key] | prop_state
+    info1.update(info2)
+    return info1
+
+
 class RxnAnalysisStep(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def execute(
         self,
@@ -726,7 +816,12 @@ class RxnAnalysisStep(abc.ABC):
         if isinstance(self, RxnAnalysisStep) and isinstance(
             other, RxnAnalysisStep
         ):
-            return RxnAnalysisStepCompound(self, other)
+            steps = _fuse_analysis_steps(
+                (*_analysis_steps(self), *_analysis_steps(other))
+            )
+            if len(steps) == 1:
+                return steps[0]
+            return RxnAnalysisStepCompound(steps)
         return as_rxn_analysis_step(self) >> as_rxn_analysis_step(other)
 
     @property
@@ -740,10 +835,9 @@ class RxnAnalysisStep(abc.ABC):
 
 @dataclasses.dataclass(frozen=True)
 class RxnAnalysisStepCompound(RxnAnalysisStep):
-    __slots__ = ("step1", "step2")
+    __slots__ = ("steps",)
 
-    step1: RxnAnalysisStep
-    step2: RxnAnalysisStep
+    steps: tuple[RxnAnalysisStep, ...]
 
     def execute(
         self,
@@ -751,17 +845,60 @@ class RxnAnalysisStepCompound(RxnAnalysisStep):
             tuple[interfaces.ReactionExplicit, bool]
         ],
     ) -> collections.abc.Iterable[tuple[interfaces.ReactionExplicit, bool]]:
-        return self.step2.execute(
-            rxn_out for rxn_out in self.step1.execute(rxns)
-        )
+        for step in self.steps:
+            rxns = step.execute(rxns)
+        return rxns
 
     @property
     def meta_required(self) -> interfaces.MetaKeyPacket:
-        return self.step1.meta_required + self.step2.meta_required
+        return functools.reduce(
+            operator.add,
+            (step.meta_required for step in self.steps),
+            interfaces.MetaKeyPacket(),
+        )
 
     @property
     def resolver(self) -> "MetaUpdateResolver":
-        return self.step1.resolver | self.step2.resolver
+        return functools.reduce(
+            operator.or_,
+            (step.resolver for step in self.steps),
+            MetaUpdateResolver({}, {}, {}),
+        )
+
+
+def _analysis_steps(
+    step: RxnAnalysisStep,
+) -> tuple[RxnAnalysisStep, ...]:
+    if isinstance(step, RxnAnalysisStepCompound):
+        return step.steps
+    return (step,)
+
+
+def _fuse_analysis_steps(
+    steps: collections.abc.Iterable[RxnAnalysisStep],
+) -> tuple[RxnAnalysisStep, ...]:
+    # runs of adjacent filters are evaluated as a single ReactionFilterAnd
+    fused: list[RxnAnalysisStep] = []
+    for step in steps:
+        if (
+            fused
+            and isinstance(step, RxnAnalysisStepFilter)
+            and isinstance(fused[-1], RxnAnalysisStepFilter)
+        ):
+            fused[-1] = RxnAnalysisStepFilter(fused[-1]._arg & step._arg)
+        else:
+            fused.append(step)
+    return tuple(fused)
+
+
+def _batched(
+    iterable: collections.abc.Iterable[_T], n: int
+) -> collections.abc.Generator[list[_T], None, None]:
+    if n < 1:
+        raise ValueError(f"Batch size must be at least 1 (got {n})")
+    it = iter(iterable)
+    while chunk := list(itertools.islice(it, n)):
+        yield chunk
 
 
 def _mmd(
@@ -775,66 +912,67 @@ def _mmd(
     collections.abc.Mapping[collections.abc.Hashable, typing.Any]
 ]:
     if i1 is None:
-        if i2 is None:
-            return None
         return i2
-    elif i2 is None:
+    if i2 is None:
         return i1
-    if not isinstance(i1, dict):
-        return dict(i1) | i2  # type: ignore [operator]
-    return i1 | i2  # type: ignore [operator]
+    try:
+        return i1 | i2  # type: ignore [operator]
+    except TypeError:
+        # at least one side is a Mapping without dict's merge operator
+        return {**i1, **i2}
+
+
+def _merge_mol_packets(
+    mols: tuple[interfaces.DataPacketE[interfaces.MolDatBase], ...],
+    mol_info: collections.abc.Mapping[
+        interfaces.Identifier, dict[collections.abc.Hashable, typing.Any]
+    ],
+) -> tuple[interfaces.DataPacketE[interfaces.MolDatBase], ...]:
+    packet = interfaces.DataPacketE
+    mmd = _mmd
+    # list comprehension lets tuple() copy with a known length
+    return tuple(
+        [
+            packet(mol.i, mol.item, mmd(mol.meta, mol_info[mol.item.uid]))
+            for mol in mols
+        ]
+    )
 
 
 def metalib_to_rxn_meta(
     metalib: MetaPropertyState,
     rxns: collections.abc.Iterable[tuple[interfaces.ReactionExplicit, bool]],
 ) -> collections.abc.Iterable[tuple[interfaces.ReactionExplicit, bool]]:
-    mol_info: dict[
+    mol_info: collections.defaultdict[
         interfaces.Identifier, dict[collections.abc.Hashable, typing.Any]
-    ] = {
-        mol.item.uid: dict()
-        for mol in itertools.chain(
-            *(
-                (itertools.chain(rxn[0].reactants, rxn[0].products))
-                for rxn in rxns
-            )
-        )
-    }
+    ] = collections.defaultdict(dict)
     for meta_key, mol_dict in metalib.mol_info.items():
         for mol_id, key_val in mol_dict.data.items():
-            mol_info[mol_id][meta_key] = key_val
-    op_info: dict[
+            d = mol_info[mol_id]
+            d[meta_key] = key_val
+    op_info: collections.defaultdict[
         interfaces.Identifier, dict[collections.abc.Hashable, typing.Any]
-    ] = {rxn[0].operator.item.uid: dict() for rxn in rxns}
+    ] = collections.defaultdict(dict)
     for meta_key, op_dict in metalib.op_info.items():
         for op_id, key_val in op_dict.data.items():
-            op_info[op_id][meta_key] = key_val
-    rxn_info: dict[
+            d = op_info[op_id]
+            d[meta_key] = key_val
+    rxn_info: collections.defaultdict[
         interfaces.Identifier, dict[collections.abc.Hashable, typing.Any]
-    ] = {rxn[0].uid: dict() for rxn in rxns}
+    ] = collections.defaultdict(dict)
     for meta_key, rxn_dict in metalib.rxn_info.items():
         for rxn_id, key_val in rxn_dict.data.items():
-            rxn_info[rxn_id][meta_key] = key_val
+            d = rxn_info[rxn_id]
+            d[meta_key] = key_val
     for rxn, passed_filter in rxns:
+        op = rxn.operator
         yield (
             interfaces.ReactionExplicit(
                 interfaces.DataPacketE(
-                    rxn.operator.i,
-                    rxn.operator.item,
-                    _mmd(rxn.operator.meta, op_info[rxn.operator.item.uid]),
-                ),
-                tuple(
-                    interfaces.DataPacketE(
-                        mol.i, mol.item, _mmd(mol.meta, mol_info[mol.item.uid])
-                    )
-                    for mol in rxn.reactants
-                ),
-                tuple(
-                    interfaces.DataPacketE(
-                        mol.i, mol.item, _mmd(mol.meta, mol_info[mol.item.uid])
-                    )
-                    for mol in rxn.products
+                    op.i, op.item, _mmd(op.meta, op_info[op.item.uid])
                 ),
+                _merge_mol_packets(rxn.reactants, mol_info),
+                _merge_mol_packets(rxn.products, mol_info),
                 _mmd(
                     rxn.reaction_meta,
                     rxn_info[rxn.uid],
@@ -844,11 +982,19 @@ def metalib_to_rxn_meta(
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class RxnAnalysisStepProp(RxnAnalysisStep):
-    __slots__ = ("_prop",)
-
+    # batch_size of None reduces properties over all incoming reactions at
+    # once; otherwise reactions are processed and yielded in chunks of that
+    # size, with properties only reduced within each chunk
     _prop: PropertyCompositor
+    batch_size: typing.Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.batch_size is not None and self.batch_size < 1:
+            raise ValueError(
+                f"Batch size must be at least 1 (got {self.batch_size})"
+            )
 
     def execute(
         self,
@@ -856,14 +1002,36 @@ class RxnAnalysisStepProp(RxnAnalysisStep):
             tuple[interfaces.ReactionExplicit, bool]
         ],
     ) -> collections.abc.Iterable[tuple[interfaces.ReactionExplicit, bool]]:
-        rxn_list = list(rxns)
-        meta_lib_generator = (self._prop(rxn[0]) for rxn in rxn_list if rxn[1])
-        try:
-            prop_map: MetaPropertyState = utils.logreduce(
-                operator.or_, meta_lib_generator
-            )
-        except TypeError:
+        calc_cache: CalcCache = {}
+        if self.batch_size is None:
+            return self._execute_chunk(list(rxns), calc_cache)
+        return itertools.chain.from_iterable(
+            self._execute_chunk(chunk, calc_cache)
+            for chunk in _batched(rxns, self.batch_size)
+        )
+
+    def _execute_chunk(
+        self,
+        rxn_list: list[tuple[interfaces.ReactionExplicit, bool]],
+        calc_cache: CalcCache,
+    ) -> collections.abc.Iterable[tuple[interfaces.ReactionExplicit, bool]]:
+        meta_lib_generator = (
+            self._prop._call_cached(rxn[0], calc_cache)
+            for rxn in rxn_list
+            if rxn[1]
+        )
+        # logreduce merges in a balanced tree, so the accumulated state is not
+        # repeatedly merged against single-reaction states; check for an empty
+        # batch up front rather than catching TypeError, which would also hide
+        # errors raised by the property calculators themselves
+        first_state = next(meta_lib_generator, None)
+        if first_state is None:
             prop_map = MetaPropertyState({}, {}, {})
+        else:
+            prop_map = utils.logreduce(
+                operator.or_,
+                itertools.chain((first_state,), meta_lib_generator),
+            )
         return metalib_to_rxn_meta(prop_map, rxn_list)
 
     @property
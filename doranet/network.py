@@ -48,8 +48,10 @@ class _ValueQueryData(
     def __contains__(
         self, item: typing.Union[interfaces.Identifier, interfaces.T_data]
     ) -> bool:
-        if isinstance(item, interfaces.DataUnit):
-            item = item.uid
+        # duck-typed check avoids the ABC instance check on every lookup
+        uid = getattr(item, "uid", None)
+        if uid is not None:
+            item = uid
         return item in self._map
 
     @typing.overload
@@ -65,9 +67,7 @@ class _ValueQueryData(
     def __getitem__(
         self, item: typing.Union[slice, interfaces.T_int, interfaces.Identifier]
     ):
-        if isinstance(item, slice):
-            return self._list[item]
-        if isinstance(item, int):
+        if isinstance(item, (int, slice)):
             return self._list[item]
         return self._list[self._map[item]]
 
@@ -116,16 +116,17 @@ class _ValueQueryData(
         collections.abc.Mapping[collections.abc.Hashable, typing.Any],
     ]:
         targets: collections.abc.Iterable[int]
-        if indices is None:
-            targets = range(len(self._meta))
-        elif index_iterable_guard(indices):
-            targets = indices
-        elif isinstance(indices, int):
+        # single indices are the most common query, so test for them first
+        if isinstance(indices, int):
             if keys is None:
                 return self._meta[indices]
             else:
                 m: collections.abc.Mapping = self._meta[indices]
                 return {key: m[key] for key in keys if key in m}
+        elif indices is None:
+            targets = range(len(self._meta))
+        elif index_iterable_guard(indices):
+            targets = indices
         else:
             raise TypeError(
                 f"Invalid argument type for `indices`: {type(indices)}"
@@ -152,11 +153,28 @@ class _ValueQueryData(
         return iter(self._list)
 
 
+_RxnKey = tuple[
+    interfaces.OpIndex,
+    tuple[interfaces.MolIndex, ...],
+    tuple[interfaces.MolIndex, ...],
+]
+
+
+def _rxn_key(rxn: interfaces.Reaction) -> _RxnKey:
+    return (rxn.operator, rxn.reactants, rxn.products)
+
+
+_T_key = typing.TypeVar("_T_key", bound=collections.abc.Hashable)
+
+
 @dataclasses.dataclass(frozen=True, slots=True)
-class _ValueQueryAssoc(typing.Generic[interfaces.T_id, interfaces.T_int]):
+class _ValueQueryAssoc(
+    typing.Generic[interfaces.T_id, interfaces.T_int, _T_key]
+):
     _list: collections.abc.Sequence[interfaces.T_id]
-    _map: collections.abc.Mapping[interfaces.T_id, interfaces.T_int]
+    _map: collections.abc.Mapping[_T_key, interfaces.T_int]
     _meta: collections.abc.Sequence[collections.abc.MutableMapping]
+    _key: collections.abc.Callable[[interfaces.T_id], _T_key]
 
     @typing.overload
     def __getitem__(
@@ -167,12 +185,10 @@ class _ValueQueryAssoc(typing.Generic[interfaces.T_id, interfaces.T_int]):
     def __getitem__(self, item: interfaces.T_int) -> interfaces.T_id: ...
 
     def __getitem__(self, item: typing.Union[slice, interfaces.T_int]):
-        if isinstance(item, slice):
-            return self._list[item]
         return self._list[item]
 
     def i(self, item: interfaces.T_id) -> interfaces.T_int:
-        return self._map[item]
+        return self._map[self._key(item)]
 
     @typing.overload
     def meta(
@@ -213,16 +229,17 @@ class _ValueQueryAssoc(typing.Generic[interfaces.T_id, interfaces.T_int]):
         collections.abc.Mapping[collections.abc.Hashable, typing.Any],
     ]:
         targets: collections.abc.Iterable[int]
-        if indices is None:
-            targets = range(len(self._meta))
-        elif index_iterable_guard(indices):
-            targets = indices
-        elif isinstance(indices, int):
+        # single indices are the most common query, so test for them first
+        if isinstance(indices, int):
             if keys is None:
                 return self._meta[indices]
             else:
                 m: collections.abc.Mapping = self._meta[indices]
                 return {key: m[key] for key in keys if key in m}
+        elif indices is None:
+            targets = range(len(self._meta))
+        elif index_iterable_guard(indices):
+            targets = indices
         else:
             raise TypeError(
                 f"Invalid argument type for `indices`: {type(indices)}"
@@ -246,6 +263,71 @@ class _ValueQueryAssoc(typing.Generic[interfaces.T_id, interfaces.T_int]):
         return iter(self._list)
 
 
+class _CompatPromise:
+    """
+    Deferred operator compatibility column.
+
+    Holds a snapshot of molecule reactivity when the operator was added, then
+    the molecules submitted afterwards in order: bare indices for molecules
+    which must be tested, and (index, argnum) pairs for molecules known to be
+    compatible with an argument.  The column is only computed when it is
+    first requested.
+    """
+
+    __slots__ = ("_op", "_arity", "_mols", "_reactive", "_pending")
+
+    def __init__(
+        self,
+        op: interfaces.OpDatBase,
+        arity: int,
+        mols: collections.abc.Sequence[interfaces.MolDatBase],
+        reactive: bytes,
+    ) -> None:
+        self._op = op
+        self._arity = arity
+        self._mols = mols
+        self._reactive = reactive
+        self._pending: list[
+            typing.Union[interfaces.MolIndex, tuple[interfaces.MolIndex, int]]
+        ] = []
+
+    def defer(
+        self, mol_index: interfaces.MolIndex, argnum: typing.Optional[int]
+    ) -> None:
+        if argnum is None:
+            self._pending.append(mol_index)
+        else:
+            self._pending.append((mol_index, argnum))
+
+    def force(self) -> tuple[list[interfaces.MolIndex], ...]:
+        op = self._op
+        mols = self._mols
+        columns: tuple[list[interfaces.MolIndex], ...] = tuple(
+            [[] for _ in range(self._arity)]
+        )
+
+        def test(mol_index: interfaces.MolIndex) -> None:
+            mol = mols[mol_index]
+            for argnum, column in enumerate(columns):
+                if op.compat(mol, argnum):
+                    column.append(mol_index)
+
+        for mol_index, reactive in enumerate(self._reactive):
+            if reactive:
+                test(interfaces.MolIndex(mol_index))
+        for entry in self._pending:
+            if isinstance(entry, tuple):
+                columns[entry[1]].append(entry[0])
+            else:
+                test(entry)
+        return columns
+
+
+_DERIVED_NETWORK_SLOTS = frozenset(
+    {"_op_arity", "_mol_query", "_op_query", "_rxn_query"}
+)
+
+
 class ChemNetworkBasic(interfaces.ChemNetwork):
     __slots__ = (
         "_mol_list",
@@ -260,6 +342,7 @@ class ChemNetworkBasic(interfaces.ChemNetwork):
         "_mol_producers",
         "_mol_consumers",
         "_compat_table",
+        "_op_arity",
         "_mol_query",
         "_op_query",
         "_rxn_query",
@@ -273,7 +356,7 @@ class ChemNetworkBasic(interfaces.ChemNetwork):
 
         self._mol_map: dict[interfaces.Identifier, interfaces.MolIndex] = {}
         self._op_map: dict[interfaces.Identifier, interfaces.OpIndex] = {}
-        self._rxn_map: dict[interfaces.Reaction, interfaces.RxnIndex] = {}
+        self._rxn_map: dict[_RxnKey, interfaces.RxnIndex] = {}
 
         self._mol_meta: list[dict] = []
         self._op_meta: list[dict] = []
@@ -283,47 +366,72 @@ class ChemNetworkBasic(interfaces.ChemNetwork):
         self._mol_consumers: list[list[interfaces.RxnIndex]] = []
 
         self._compat_table: list[
-            collections.abc.Sequence[list[interfaces.MolIndex]]
+            typing.Union[
+                _CompatPromise,
+                collections.abc.Sequence[list[interfaces.MolIndex]],
+            ]
         ] = []
-
-        self._mol_query: typing.Optional[
-            _ValueQueryData[interfaces.MolDatBase, interfaces.MolIndex]
-        ] = None
-        self._op_query: typing.Optional[
-            _ValueQueryData[interfaces.OpDatBase, interfaces.OpIndex]
-        ] = None
-        self._rxn_query: typing.Optional[
-            _ValueQueryAssoc[interfaces.Reaction, interfaces.RxnIndex]
-        ] = None
+        self._op_arity: list[int] = []
 
         self._reactive_list: list[bool] = []
 
+        self._build_queries()
+
+    def _build_queries(self) -> None:
+        # query objects hold references to the tables, so they stay current
+        self._mol_query: _ValueQueryData[
+            interfaces.MolDatBase, interfaces.MolIndex
+        ] = _ValueQueryData(self._mol_list, self._mol_map, self._mol_meta)
+        self._op_query: _ValueQueryData[
+            interfaces.OpDatBase, interfaces.OpIndex
+        ] = _ValueQueryData(self._op_list, self._op_map, self._op_meta)
+        self._rxn_query: _ValueQueryAssoc[
+            interfaces.Reaction, interfaces.RxnIndex, _RxnKey
+        ] = _ValueQueryAssoc(
+            self._rxn_list, self._rxn_map, self._rxn_meta, _rxn_key
+        )
+
+    def __getstate__(self) -> tuple[None, dict[str, typing.Any]]:
+        # query objects and operator arities are rebuilt by __setstate__
+        return None, {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name not in _DERIVED_NETWORK_SLOTS
+        }
+
+    def __setstate__(self, state: tuple[None, dict[str, typing.Any]]) -> None:
+        _, slots = state
+        for name, value in slots.items():
+            if name not in _DERIVED_NETWORK_SLOTS:
+                setattr(self, name, value)
+        # rebuild derived tables, which are either skipped when pickling or
+        # may use older layouts in networks pickled by earlier versions
+        if not hasattr(self, "_op_arity"):
+            self._op_arity = [len(op) for op in self._op_list]
+        if isinstance(next(iter(self._rxn_map), None), interfaces.Reaction):
+            legacy_map = typing.cast(
+                dict[interfaces.Reaction, interfaces.RxnIndex], self._rxn_map
+            )
+            self._rxn_map = {
+                _rxn_key(rxn): rxn_index
+                for rxn, rxn_index in legacy_map.items()
+            }
+        self._build_queries()
+
     @property
     def mols(
         self,
     ) -> _ValueQueryData[interfaces.MolDatBase, interfaces.MolIndex]:
-        if self._mol_query is None:
-            self._mol_query = _ValueQueryData(
-                self._mol_list, self._mol_map, self._mol_meta
-            )
         return self._mol_query
 
     @property
     def ops(self) -> _ValueQueryData[interfaces.OpDatBase, interfaces.OpIndex]:
-        if self._op_query is None:
-            self._op_query = _ValueQueryData(
-                self._op_list, self._op_map, self._op_meta
-            )
         return self._op_query
 
     @property
     def rxns(
         self,
-    ) -> _ValueQueryAssoc[interfaces.Reaction, interfaces.RxnIndex]:
-        if self._rxn_query is None:
-            self._rxn_query = _ValueQueryAssoc(
-                self._rxn_list, self._rxn_map, self._rxn_meta
-            )
+    ) -> _ValueQueryAssoc[interfaces.Reaction, interfaces.RxnIndex, _RxnKey]:
         return self._rxn_query
 
     def compat_table(
@@ -331,14 +439,18 @@ class ChemNetworkBasic(interfaces.ChemNetwork):
     ) -> collections.abc.Sequence[
         collections.abc.Sequence[interfaces.MolIndex]
     ]:
-        return self._compat_table[index]
+        columns = self._compat_table[index]
+        if isinstance(columns, _CompatPromise):
+            columns = columns.force()
+            self._compat_table[index] = columns
+        return columns
 
     def consumers(
         self,
         mol: typing.Union[int, interfaces.MolDatBase, interfaces.Identifier],
     ) -> collections.abc.Collection[interfaces.RxnIndex]:
         if isinstance(mol, int):
-            return self._mol_consumers[interfaces.MolIndex(mol)]
+            return self._mol_consumers[mol]
         elif isinstance(mol, interfaces.MolDatBase):
             return self._mol_consumers[self._mol_map[mol.uid]]
         return self._mol_consumers[self._mol_map[mol]]
@@ -348,7 +460,7 @@ class ChemNetworkBasic(interfaces.ChemNetwork):
         mol: typing.Union[int, interfaces.MolDatBase, interfaces.Identifier],
     ) -> collections.abc.Collection[interfaces.RxnIndex]:
         if isinstance(mol, int):
-            return self._mol_producers[interfaces.MolIndex(mol)]
+            return self._mol_producers[mol]
         elif isinstance(mol, interfaces.MolDatBase):
             return self._mol_producers[self._mol_map[mol.uid]]
         return self._mol_producers[self._mol_map[mol]]
@@ -366,6 +478,56 @@ class ChemNetworkBasic(interfaces.ChemNetwork):
             raise ValueError(
                 "`_custom_compat` cannot be specified when `reactive` is False"
             )
+        mol_index, newly_reactive = self._insert_mol(mol, meta, reactive)
+        # if newly reactive, fill in compat table
+        if newly_reactive:
+            self._add_mol_compat(mol, mol_index, _custom_compat)
+        return mol_index
+
+    def add_mols(
+        self,
+        mols: collections.abc.Iterable[interfaces.MolDatBase],
+        meta: typing.Optional[collections.abc.Mapping] = None,
+        reactive: typing.Optional[bool] = None,
+    ) -> list[interfaces.MolIndex]:
+        indices: list[interfaces.MolIndex] = []
+        new_reactive: list[
+            tuple[interfaces.MolIndex, interfaces.MolDatBase]
+        ] = []
+        for mol in mols:
+            mol_index, newly_reactive = self._insert_mol(mol, meta, reactive)
+            indices.append(mol_index)
+            if newly_reactive:
+                new_reactive.append((mol_index, mol))
+        if not new_reactive:
+            return indices
+
+        # test operator compatibility for the whole batch, one operator at a
+        # time
+        for op, arity, columns in zip(
+            self._op_list, self._op_arity, self._compat_table, strict=True
+        ):
+            if isinstance(columns, _CompatPromise):
+                for mol_index, _ in new_reactive:
+                    columns.defer(mol_index, None)
+                continue
+            compat = op.compat
+            for argnum in range(arity):
+                columns[argnum].extend(
+                    [
+                        mol_index
+                        for mol_index, mol in new_reactive
+                        if compat(mol, argnum)
+                    ]
+                )
+        return indices
+
+    def _insert_mol(
+        self,
+        mol: interfaces.MolDatBase,
+        meta: typing.Optional[collections.abc.Mapping],
+        reactive: typing.Optional[bool],
+    ) -> tuple[interfaces.MolIndex, bool]:
         # if already in database, return existing index
         mol_uid = mol.uid
         if mol_uid in self._mol_map:
@@ -373,21 +535,11 @@ class ChemNetworkBasic(interfaces.ChemNetwork):
             if meta is not None:
                 self._mol_meta[mol_index].update(meta)
 
-            if reactive is not True:
-                return mol_index
-
-            # if newly reactive, fill in compat table
-            if not self._reactive_list[mol_index]:
-                self._reactive_list[mol_index] = True
-                if _custom_compat is None:
-                    for i, op in enumerate(self.ops):
-                        for argnum in range(len(op)):
-                            if op.compat(mol, argnum):
-                                self._compat_table[i][argnum].append(mol_index)
-                else:
-                    for op_index, argnum in _custom_compat:
-                        self._compat_table[op_index][argnum].append(mol_index)
-            return mol_index
+            if reactive is not True or self._reactive_list[mol_index]:
+                return mol_index, False
+
+            self._reactive_list[mol_index] = True
+            return mol_index, True
 
         # add mol to main mol list
         mol_index = interfaces.MolIndex(len(self._mol_list))
@@ -407,18 +559,36 @@ class ChemNetworkBasic(interfaces.ChemNetwork):
             self._mol_meta.append(dict(meta))
 
         self._reactive_list.append(reactive is not False)
-        if reactive is not False:
-            if _custom_compat is None:
-                # test operator compatibility and add to table
-                for i, op in enumerate(self.ops):
-                    for argnum in range(len(op)):
-                        if op.compat(mol, argnum):
-                            self._compat_table[i][argnum].append(mol_index)
-            else:
-                for op_index, argnum in _custom_compat:
-                    self._compat_table[op_index][argnum].append(mol_index)
+        return mol_index, reactive is not False
 
-        return mol_index
+    def _add_mol_compat(
+        self,
+        mol: interfaces.MolDatBase,
+        mol_index: interfaces.MolIndex,
+        custom_compat: typing.Optional[
+            collections.abc.Collection[tuple[interfaces.OpIndex, int]]
+        ],
+    ) -> None:
+        compat_table = self._compat_table
+        if custom_compat is not None:
+            for op_index, argnum in custom_compat:
+                columns = compat_table[op_index]
+                if isinstance(columns, _CompatPromise):
+                    columns.defer(mol_index, argnum)
+                else:
+                    columns[argnum].append(mol_index)
+            return
+        # test operator compatibility and add to table; operators whose
+        # columns have not been requested yet are tested when forced
+        for op, arity, columns in zip(
+            self._op_list, self._op_arity, compat_table, strict=True
+        ):
+            if isinstance(columns, _CompatPromise):
+                columns.defer(mol_index, None)
+                continue
+            for argnum in range(arity):
+                if op.compat(mol, argnum):
+                    columns[argnum].append(mol_index)
 
     def add_op(
         self,
@@ -446,18 +616,15 @@ class ChemNetworkBasic(interfaces.ChemNetwork):
         else:
             self._op_meta.append(dict(meta))
 
-        # test operator compatibility and add to table
+        # defer operator compatibility tests until the table is requested
+        arity = len(op)
+        self._op_arity.append(arity)
         self._compat_table.append(
-            tuple(
-                [
-                    [
-                        interfaces.MolIndex(mol_index)
-                        for mol_index, mol in enumerate(self._mol_list)
-                        if self._reactive_list[mol_index]
-                        and op.compat(mol, argnum)
-                    ]
-                    for argnum in range(len(op))
-                ]
+            _CompatPromise(
+                op,
+                arity,
+                self._mol_list,
+                bytes(self._reactive_list),
             )
         )
 
@@ -482,22 +649,24 @@ class ChemNetworkBasic(interfaces.ChemNetwork):
                         ({products}) must all be specified if reaction is
                         None"""
                 )
-            rxn = interfaces.Reaction(
-                operator, tuple(reactants), tuple(products)
-            )
+            key: _RxnKey = (operator, tuple(reactants), tuple(products))
+        else:
+            key = _rxn_key(rxn)
 
         # if already in database, return existing index
-        if rxn in self._rxn_map:
-            rxn_index = self._rxn_map[rxn]
+        rxn_index = self._rxn_map.get(key)
+        if rxn_index is not None:
             if meta is not None:
                 self._rxn_meta[rxn_index].update(meta)
             return rxn_index
 
+        if rxn is None:
+            rxn = interfaces.Reaction(*key)
+
         # sanity check that all reactants and products exist in the network
-        if (
-            max(*rxn.reactants, *rxn.products) >= len(self._mol_list)
-            or min(*rxn.reactants, *rxn.products) < 0
-        ):
+        n_mols = len(self._mol_list)
+        mol_indices = (*rxn.reactants, *rxn.products)
+        if mol_indices and (min(mol_indices) < 0 or max(mol_indices) >= n_mols):
             raise IndexError(
                 f"""One of the molecule components for reaction {rxn} is not in
                     the network."""
@@ -513,7 +682,7 @@ class ChemNetworkBasic(interfaces.ChemNetwork):
         self._rxn_list.append(rxn)
 
         # add rxn to index mapping
-        self._rxn_map[rxn] = rxn_index
+        self._rxn_map[key] = rxn_index
 
         # add consumption/production mappings
         for i in rxn.reactants:
@@ -600,10 +769,15 @@ class ChemNetworkFacadeMetaTrigger(interfaces.ChemNetwork):
 
 
 def dump_network_to_file(
-    network: interfaces.ChemNetwork, filepath: str = "network.dat"
+    network: interfaces.ChemNetwork,
+    filepath: str = "network.dat",
+    minimal: bool = False,
 ) -> None:
-    with gzip.open(filepath, "wb") as fout:
-        pickle.dump(network, fout)
+    compress_level = 6
+    if minimal:
+        compress_level = 9
+    with gzip.open(filepath, "wb", compress_level) as fout:
+        pickle.dump(network, fout, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def load_network_from_file(
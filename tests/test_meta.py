@@ -1,5 +1,7 @@
 """Test metadata updates."""
 
+import pytest
+
 import doranet as dn
 
 
@@ -21,3 +23,225 @@ def test_meta_update():
     assert network.mols.meta(dn.interfaces.MolIndex(1), ("gen",))["gen"] == 1
     assert network.mols.meta(dn.interfaces.MolIndex(2), ("gen",))["gen"] == 1
     assert network.mols.meta(dn.interfaces.MolIndex(3), ("gen",))["gen"] == 2  # noqa: PLR2004
+
+
+class _CountingCalc(dn.metadata.MolPropertyCalc[int]):
+    def __init__(self):
+        self.calls = []
+
+    @property
+    def key(self):
+        return "n_atoms"
+
+    @property
+    def meta_required(self):
+        return dn.interfaces.MetaKeyPacket()
+
+    @property
+    def resolver(self):
+        return dn.metadata.TrivialMetaDataResolverFunc
+
+    def __call__(self, data, prev_value=None):
+        self.calls.append((data.item.uid, data.i))
+        return data.item.rdkitmol.GetNumAtoms()
+
+
+class _RaisingCalc(_CountingCalc):
+    def __call__(self, data, prev_value=None):
+        raise TypeError("calculator failure")
+
+
+def test_calc_type_error_propagates():
+    engine = dn.create_engine()
+    network = engine.new_network()
+    network.add_mol(engine.mol.rdkit("C#C"))
+    network.add_op(engine.op.rdkit("[C:1]#[C:2]>>[*:1]=[*:2]"))
+
+    strat = engine.strat.cartesian(network)
+    with pytest.raises(TypeError, match="calculator failure"):
+        strat.expand(num_iter=1, reaction_plan=_RaisingCalc())
+
+
+def test_mol_calc_cached_within_step():
+    engine = dn.create_engine()
+    network = engine.new_network()
+    network.add_mol(engine.mol.rdkit("C#C"))
+    network.add_mol(engine.mol.rdkit("C=C"))
+    network.add_op(engine.op.rdkit("[C:1]#[C:2]>>[*:1]=[*:2]"))
+    network.add_op(engine.op.rdkit("[C:1]#[C:2]>>[*:1]-[*:2]"))
+    network.add_op(engine.op.rdkit("[C:1]=[C:2]>>[*:1]-[*:2]"))
+
+    calc = _CountingCalc()
+    strat = engine.strat.cartesian(network)
+    strat.expand(num_iter=1, reaction_plan=calc)
+
+    assert len(calc.calls) == len(set(calc.calls))
+    for i in range(len(network.mols)):
+        assert network.mols.meta(dn.interfaces.MolIndex(i))["n_atoms"] == 2  # noqa: PLR2004
+
+
+class _LegacyCompositor(dn.metadata.PropertyCompositor):
+    # written against the original one-argument __call__ contract
+    def __call__(self, rxn):
+        props = {rxn.operator.item.uid: len(rxn.reactants)}
+        single_state = dn.metadata.MetaPropertyStateSingleProp(
+            props, dn.metadata.TrivialMetaDataResolverFunc
+        )
+        return dn.metadata.MetaPropertyState({}, {"arity": single_state}, {})
+
+    @property
+    def keys(self):
+        return dn.metadata.KeyOutput(
+            frozenset(), frozenset(("arity",)), frozenset()
+        )
+
+    @property
+    def meta_required(self):
+        return dn.interfaces.MetaKeyPacket()
+
+    @property
+    def resolver(self):
+        return dn.metadata.MetaUpdateResolver(
+            {}, {"arity": dn.metadata.TrivialMetaDataResolverFunc}, {}
+        )
+
+
+def test_legacy_compositor_signature():
+    engine = dn.create_engine()
+    network = engine.new_network()
+    network.add_mol(engine.mol.rdkit("C#C"), meta={"gen": 0})
+    network.add_op(engine.op.rdkit("[C:1]#[C:2]>>[*:1]=[*:2]"))
+
+    strat = engine.strat.cartesian(network)
+    plan = dn.metadata.RxnAnalysisStepProp(
+        _LegacyCompositor()
+        & dn.metadata.MolRxnPropertyCompositor(
+            dn.metacalc.GenerationCalculator("gen")
+        )
+    )
+    strat.expand(num_iter=1, reaction_plan=plan)
+
+    assert network.ops.meta(dn.interfaces.OpIndex(0))["arity"] == 1
+    assert network.mols.meta(dn.interfaces.MolIndex(1), ("gen",))["gen"] == 1
+
+
+def test_merge_conflicting_keys():
+    weight = dn.metacalc.MolWeightCalculator("mw")
+    merged = weight & dn.metacalc.GenerationCalculator("gen")
+    assert merged.keys.mol_keys == frozenset(("mw", "gen"))
+    with pytest.raises(KeyError):
+        weight & dn.metacalc.MolWeightCalculator("mw")
+
+
+def test_meta_update_batched():
+    engine = dn.create_engine()
+    network = engine.new_network()
+    network.add_mol(engine.mol.rdkit("C#C"), meta={"gen": 0})
+    network.add_op(engine.op.rdkit("[C:1]#[C:2]>>[*:1]=[*:2]"))
+    network.add_op(engine.op.rdkit("[C:1]#[C:2]>>[*:1]-[*:2]"))
+    network.add_op(engine.op.rdkit("[C:1]=[C:2]>>[*:1]-[*:2]"))
+
+    strat = engine.strat.cartesian(network)
+
+    plan = dn.metadata.RxnAnalysisStepProp(
+        dn.metadata.MolRxnPropertyCompositor(
+            dn.metacalc.GenerationCalculator("gen")
+        ),
+        batch_size=1,
+    )
+    strat.expand(num_iter=2, reaction_plan=plan)
+
+    assert network.mols.meta(dn.interfaces.MolIndex(0), ("gen",))["gen"] == 0
+    assert network.mols.meta(dn.interfaces.MolIndex(1), ("gen",))["gen"] == 1
+    assert network.mols.meta(dn.interfaces.MolIndex(2), ("gen",))["gen"] == 1
+
+
+def test_batch_size_validated():
+    comp = dn.metadata.MolRxnPropertyCompositor(
+        dn.metacalc.GenerationCalculator("gen")
+    )
+    with pytest.raises(ValueError):
+        dn.metadata.RxnAnalysisStepProp(comp, batch_size=0)
+
+
+class _ProductCountFilter(dn.metadata.ReactionFilterBase):
+    def __call__(self, recipe):
+        return len(recipe.products) == 1
+
+
+class _GenerationFilter(dn.metadata.ReactionFilterBase):
+    def __call__(self, recipe):
+        return all(mol.meta["gen"] <= 1 for mol in recipe.products)
+
+    @property
+    def meta_required(self):
+        return dn.interfaces.MetaKeyPacket(molecule_keys={"gen"})
+
+
+class _NoEthaneFilter(dn.metadata.ReactionFilterBase):
+    def __call__(self, recipe):
+        return all(mol.item.uid != "CC" for mol in recipe.products)
+
+    @property
+    def meta_required(self):
+        return dn.interfaces.MetaKeyPacket(live_molecule=True)
+
+
+def _expand_with_plan(engine, plan):
+    network = engine.new_network()
+    network.add_mol(engine.mol.rdkit("C#C"), meta={"gen": 0})
+    network.add_op(engine.op.rdkit("[C:1]#[C:2]>>[*:1]=[*:2]"))
+    network.add_op(engine.op.rdkit("[C:1]#[C:2]>>[*:1]-[*:2]"))
+    network.add_op(engine.op.rdkit("[C:1]=[C:2]>>[*:1]-[*:2]"))
+    network.add_op(engine.op.rdkit("[C:1]=[C:2]>>[*:1].[*:2]"))
+    engine.strat.cartesian(network).expand(num_iter=3, reaction_plan=plan)
+    return network
+
+
+def test_filter_fusion():
+    engine = dn.create_engine()
+    count_filter = _ProductCountFilter()
+    gen_filter = _GenerationFilter()
+    ethane_filter = _NoEthaneFilter()
+    gen_comp = dn.metadata.MolRxnPropertyCompositor(
+        dn.metacalc.GenerationCalculator("gen")
+    )
+
+    fused = count_filter >> gen_comp >> gen_filter >> ethane_filter
+
+    assert isinstance(fused, dn.metadata.RxnAnalysisStepCompound)
+    assert len(fused.steps) == 3  # noqa: PLR2004
+    first, prop, last = fused.steps
+    assert isinstance(first, dn.metadata.RxnAnalysisStepFilter)
+    assert isinstance(prop, dn.metadata.RxnAnalysisStepProp)
+    assert isinstance(last, dn.metadata.RxnAnalysisStepFilter)
+    assert isinstance(last._arg, dn.metadata.ReactionFilterAnd)
+    assert (gen_filter >> ethane_filter)._arg == last._arg
+    assert fused.meta_required == dn.interfaces.MetaKeyPacket(
+        molecule_keys={"gen"}, live_molecule=True
+    )
+
+    unfused = dn.metadata.RxnAnalysisStepCompound(
+        (
+            dn.metadata.RxnAnalysisStepFilter(count_filter),
+            dn.metadata.RxnAnalysisStepProp(gen_comp),
+            dn.metadata.RxnAnalysisStepFilter(gen_filter),
+            dn.metadata.RxnAnalysisStepFilter(ethane_filter),
+        )
+    )
+    assert unfused.meta_required == fused.meta_required
+
+    fused_network = _expand_with_plan(engine, fused)
+    unfused_network = _expand_with_plan(engine, unfused)
+    assert [mol.uid for mol in fused_network.mols] == [
+        mol.uid for mol in unfused_network.mols
+    ]
+    assert tuple(fused_network.mols.meta()) == tuple(
+        unfused_network.mols.meta()
+    )
+    assert tuple(fused_network.rxns) == tuple(unfused_network.rxns)
+    assert list(fused_network.reactivity) == list(unfused_network.reactivity)
+    # products of rejected reactions are saved, but not made reactive
+    assert fused_network.reactivity[fused_network.mols.i("C=C")]
+    assert not fused_network.reactivity[fused_network.mols.i("CC")]
+    assert not fused_network.reactivity[fused_network.mols.i("C")]
@@ -0,0 +1,135 @@
+"""Test network data structures."""
+
+import os
+import pickle
+import tempfile
+
+import pytest
+
+import doranet as dn
+
+
+def test_compat_table_deferred():
+    engine = dn.create_engine()
+    network = engine.new_network()
+
+    acetone = engine.mol.rdkit("CC(C)=O")
+    water = engine.mol.rdkit("O")
+    butanone = engine.mol.rdkit("CCC(C)=O")
+    aldol_condensation = engine.op.rdkit(
+        "[O&+0:1]=[C&+0:2]-[C&+0;H2,H3:3].[C&+0:4]=[O&+0:5]>>[*:1]=[*:2]-[*:3]=[*:4].[*:5]"
+    )
+
+    network.add_mol(acetone)
+    network.add_mol(water, reactive=False)
+    op_index = network.add_op(aldol_condensation)
+    network.add_mol(butanone)
+    network.add_mol(water, reactive=True)
+
+    assert network.compat_table(op_index) == ([0, 2], [0, 2])
+
+    # columns stay up to date once they have been computed
+    ethanal = engine.mol.rdkit("CC=O")
+    network.add_mol(ethanal)
+    assert network.compat_table(op_index) == ([0, 2, 3], [0, 2, 3])
+
+    # custom compatibility is kept in order while a column is deferred
+    op_index = network.add_op(engine.op.rdkit("[C:1]=[O:2]>>[*:1]-[*:2]"))
+    propanal = network.add_mol(
+        engine.mol.rdkit("CCC=O"), _custom_compat=[(op_index, 0)]
+    )
+    network.add_mol(engine.mol.rdkit("CC#C"))
+    assert network.compat_table(op_index) == ([0, 2, 3, propanal],)
+
+
+def test_add_mols_matches_add_mol():
+    engine = dn.create_engine()
+    aldol_condensation = engine.op.rdkit(
+        "[O&+0:1]=[C&+0:2]-[C&+0;H2,H3:3].[C&+0:4]=[O&+0:5]>>[*:1]=[*:2]-[*:3]=[*:4].[*:5]"
+    )
+    smiles = ["CC(C)=O", "O", "CCC(C)=O", "CC(C)=O", "CC=O"]
+
+    single = engine.new_network()
+    single.add_op(aldol_condensation)
+    single.compat_table(0)
+    single_indices = [single.add_mol(engine.mol.rdkit(smi)) for smi in smiles]
+
+    batch = engine.new_network()
+    batch.add_op(aldol_condensation)
+    batch.compat_table(0)
+    batch_indices = batch.add_mols(engine.mol.rdkit(smi) for smi in smiles)
+
+    assert batch_indices == single_indices == [0, 1, 2, 0, 3]
+    assert batch.compat_table(0) == single.compat_table(0)
+
+
+def test_add_rxn_bounds_check():
+    engine = dn.create_engine()
+    network = engine.new_network()
+    ethanol = network.add_mol(engine.mol.rdkit("CCO"))
+    op_index = network.add_op(engine.op.rdkit("[C:1]>>[C:1]"))
+
+    assert network.add_rxn(op_index, [ethanol], []) == 0
+    with pytest.raises(IndexError):
+        network.add_rxn(op_index, [ethanol], [ethanol + 1])
+    with pytest.raises(IndexError):
+        network.add_rxn(op_index, [-1], [])
+
+
+def test_network_pickle_roundtrip():
+    engine = dn.create_engine()
+    network = engine.new_network()
+    acetone = network.add_mol(engine.mol.rdkit("CC(C)=O"), meta={"gen": 0})
+    op_index = network.add_op(
+        engine.op.rdkit(
+            "[O&+0:1]=[C&+0:2]-[C&+0;H2,H3:3].[C&+0:4]=[O&+0:5]>>[*:1]=[*:2]-[*:3]=[*:4].[*:5]"
+        )
+    )
+    water = network.add_mol(engine.mol.rdkit("O"))
+    rxn_index = network.add_rxn(op_index, [acetone, acetone], [water])
+
+    loaded = pickle.loads(pickle.dumps(network))
+
+    assert loaded.mols.meta(acetone) == {"gen": 0}
+    assert loaded.rxns.i(network.rxns[rxn_index]) == rxn_index
+    assert loaded.compat_table(op_index) == ([0], [0])
+    ethanal = loaded.add_mol(engine.mol.rdkit("CC=O"))
+    assert loaded.compat_table(op_index) == ([0, ethanal], [0, ethanal])
+
+
+@pytest.mark.parametrize("minimal", [False, True])
+def test_dump_network_roundtrip(minimal):
+    engine = dn.create_engine()
+    network = engine.new_network()
+    ethanol = network.add_mol(engine.mol.rdkit("CCO"), meta={"gen": 0})
+    op_index = network.add_op(engine.op.rdkit("[C:1]-[O:2]>>[*:1]=[*:2]"))
+    ethanal = network.add_mol(engine.mol.rdkit("CC=O"), reactive=False)
+    network.add_rxn(op_index, [ethanol], [ethanal])
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        filepath = os.path.join(tempdir, "network.dat")
+        dn.network.dump_network_to_file(network, filepath, minimal=minimal)
+        loaded = dn.network.load_network_from_file(filepath)
+
+    assert [mol.uid for mol in loaded.mols] == [mol.uid for mol in network.mols]
+    assert loaded.mols.meta(ethanol) == {"gen": 0}
+    assert list(loaded.reactivity) == [True, False]
+    assert list(loaded.rxns) == list(network.rxns)
+    assert loaded.compat_table(op_index) == network.compat_table(op_index)
+
+
+def test_consumers_producers_lookup():
+    engine = dn.create_engine()
+    network = engine.new_network()
+    ethanol_mol = engine.mol.rdkit("CCO")
+    ethanol = network.add_mol(ethanol_mol)
+    ethanal = network.add_mol(engine.mol.rdkit("CC=O"))
+    op_index = network.add_op(engine.op.rdkit("[C:1]-[O:2]>>[*:1]=[*:2]"))
+    rxn_index = network.add_rxn(op_index, [ethanol], [ethanal])
+
+    assert network.consumers(ethanol) == [rxn_index]
+    assert network.consumers(ethanol_mol) == [rxn_index]
+    assert network.consumers("CCO") == [rxn_index]
+    assert network.producers(ethanal) == [rxn_index]
+    assert network.producers("CC=O") == [rxn_index]
+    assert network.producers(ethanol_mol) == []